@@ -295,6 +295,9 @@ options:
             - B(Deprecated)
             - Please use M(panos_commit_firewall), M(panos_commit_panorama),
               M(panos_commit_push) instead.
+            - Each task with this option enabled runs its own commit, which can take
+              minutes on large configurations.  A single commit task at the end of the
+              play commits all of the changes at once.
             - HORIZONTALLINE
             - Commit changes after creating object.  If I(ip_address) is a Panorama device, and I(device_group) or
               I(template) are also set, perform a commit to Panorama and a commit-all to the device group/template.
@@ -33,7 +33,7 @@ import re
 import shlex
 import sys
 import time
-from functools import reduce
+from functools import lru_cache, reduce
 import importlib
 
 from ansible.module_utils.basic import AnsibleModule
@@ -82,6 +82,7 @@ def eltostr(obj):
         return obj.element_str()
 
 
+@lru_cache(maxsize=None)
 def to_sdk_cls(pkg_name, cls_name):
     sdk_names = ("panos", "pandevice")
 
@@ -263,56 +263,84 @@ except ImportError:
         pass
 
 
-def setup_args():
-    return dict(
-        commit=dict(type="bool"),
-        ha_enabled=dict(type="bool", default=True),
-        ha_group_id=dict(type="int", default=1),
-        ha_config_sync=dict(type="bool", default=True),
-        ha_peer_ip=dict(type="str"),
-        ha_peer_ip_backup=dict(type="str"),
-        ha_mode=dict(
-            type="str",
-            choices=["active-passive", "active-active"],
-            default="active-passive",
-        ),
-        ha_passive_link_state=dict(
-            type="str", choices=["shutdown", "auto"], default="auto"
-        ),
-        ha_state_sync=dict(type="bool", default=False),
-        ha_ha2_keepalive=dict(type="bool", default=True),
-        ha_ha2_keepalive_action=dict(type="str"),
-        ha_ha2_keepalive_threshold=dict(type="int"),
-        ha_device_id=dict(type="int", choices=[0, 1]),
-        ha_session_owner_selection=dict(
-            type="str", choices=["primary-device", "first-packet"]
-        ),
-        ha_session_setup=dict(
-            type="str",
-            choices=["primary-device", "first-packet", "ip-modulo", "ip-hash"],
-        ),
-        ha_tentative_hold_time=dict(type="int"),
-        ha_sync_qos=dict(type="bool"),
-        ha_sync_virtual_router=dict(type="bool"),
-        ha_ip_hash_key=dict(type="str", choices=["source", "source-and-destination"]),
-        ha1_ip_address=dict(type="str"),
-        ha1_netmask=dict(type="str"),
-        ha1_port=dict(type="str"),
-        ha1_gateway=dict(type="str"),
-        ha1b_ip_address=dict(type="str"),
-        ha1b_netmask=dict(type="str"),
-        ha1b_port=dict(type="str"),
-        ha1b_gateway=dict(type="str"),
-        ha2_ip_address=dict(type="str"),
-        ha2_netmask=dict(type="str"),
-        ha2_port=dict(type="str", default="ha2-a"),
-        ha2_gateway=dict(type="str"),
-        ha2b_ip_address=dict(type="str"),
-        ha2b_netmask=dict(type="str"),
-        ha2b_port=dict(type="str"),
-        ha2b_gateway=dict(type="str"),
-        ha3_port=dict(type="str"),
-    )
+# Params of ha.HighAvailability, minus their "ha_" prefix.
+_HA_FIELDS = (
+    "enabled",
+    "group_id",
+    "config_sync",
+    "peer_ip",
+    "peer_ip_backup",
+    "mode",
+    "passive_link_state",
+    "state_sync",
+    "ha2_keepalive",
+    "ha2_keepalive_action",
+    "ha2_keepalive_threshold",
+    "device_id",
+    "session_owner_selection",
+    "session_setup",
+    "tentative_hold_time",
+    "sync_qos",
+    "sync_virtual_router",
+    "ip_hash_key",
+)
+
+# Params of the HA1, HA1Backup, HA2, and HA2Backup interfaces, minus their prefix.
+_HA_INTERFACE_FIELDS = ("ip_address", "netmask", "port", "gateway")
+
+# Params of the HA3 interface, minus the "ha3_" prefix.
+_HA3_FIELDS = ("port",)
+
+
+_ARGUMENT_SPEC = dict(
+    commit=dict(type="bool"),
+    ha_enabled=dict(type="bool", default=True),
+    ha_group_id=dict(type="int", default=1),
+    ha_config_sync=dict(type="bool", default=True),
+    ha_peer_ip=dict(type="str"),
+    ha_peer_ip_backup=dict(type="str"),
+    ha_mode=dict(
+        type="str",
+        choices=["active-passive", "active-active"],
+        default="active-passive",
+    ),
+    ha_passive_link_state=dict(
+        type="str", choices=["shutdown", "auto"], default="auto"
+    ),
+    ha_state_sync=dict(type="bool", default=False),
+    ha_ha2_keepalive=dict(type="bool", default=True),
+    ha_ha2_keepalive_action=dict(type="str"),
+    ha_ha2_keepalive_threshold=dict(type="int"),
+    ha_device_id=dict(type="int", choices=[0, 1]),
+    ha_session_owner_selection=dict(
+        type="str", choices=["primary-device", "first-packet"]
+    ),
+    ha_session_setup=dict(
+        type="str",
+        choices=["primary-device", "first-packet", "ip-modulo", "ip-hash"],
+    ),
+    ha_tentative_hold_time=dict(type="int"),
+    ha_sync_qos=dict(type="bool"),
+    ha_sync_virtual_router=dict(type="bool"),
+    ha_ip_hash_key=dict(type="str", choices=["source", "source-and-destination"]),
+    ha1_ip_address=dict(type="str"),
+    ha1_netmask=dict(type="str"),
+    ha1_port=dict(type="str"),
+    ha1_gateway=dict(type="str"),
+    ha1b_ip_address=dict(type="str"),
+    ha1b_netmask=dict(type="str"),
+    ha1b_port=dict(type="str"),
+    ha1b_gateway=dict(type="str"),
+    ha2_ip_address=dict(type="str"),
+    ha2_netmask=dict(type="str"),
+    ha2_port=dict(type="str", default="ha2-a"),
+    ha2_gateway=dict(type="str"),
+    ha2b_ip_address=dict(type="str"),
+    ha2b_netmask=dict(type="str"),
+    ha2b_port=dict(type="str"),
+    ha2b_gateway=dict(type="str"),
+    ha3_port=dict(type="str"),
+)
 
 
 def main():
@@ -323,7 +351,7 @@ def main():
         with_state=True,
         min_pandevice_version=(0, 13, 0),
         with_classic_provider_spec=True,
-        argument_spec=setup_args(),
+        argument_spec=_ARGUMENT_SPEC,
     )
 
     module = AnsibleModule(
@@ -341,102 +369,40 @@ def main():
     except PanDeviceError as e:
         module.fail_json(msg="Failed refresh: {0}".format(e))
 
-    # Exclude non-object items from kwargs passed to the object.
-    exclude_list = [
-        "ip_address",
-        "username",
-        "password",
-        "api_key",
-        "state",
-        "commit",
-        "provider",
-        "template",
-        "template_stack",
-        "vsys",
-        "port",
-    ]
-
-    # Remove excluded items from spec
-    spec_included = dict(
-        (k, module.params[k])
-        for k in helper.argument_spec.keys()
-        if k not in exclude_list
-    )
-
-    # Generate the kwargs for ha.HighAvailability
-    ha_obj_spec = {
-        k.replace("ha_", ""): spec_included[k]
-        for k in spec_included
-        if k.startswith("ha_")
-    }
-
-    # Generate the kwargs for ha.HA1
-    ha1_obj_spec = {
-        k.replace("ha1_", ""): spec_included[k]
-        for k in spec_included
-        if k.startswith("ha1_")
-    }
-
-    # Generate the kwargs for ha.HA1Backup
-    ha1b_obj_spec = {
-        k.replace("ha1b_", ""): spec_included[k]
-        for k in spec_included
-        if k.startswith("ha1b_")
-    }
-
-    # Generate the kwargs for ha.HA2
-    ha2_obj_spec = {
-        k.replace("ha2_", ""): spec_included[k]
-        for k in spec_included
-        if k.startswith("ha2_")
-    }
-
-    # Generate the kwargs for ha.HA2Backup
-    ha2b_obj_spec = {
-        k.replace("ha2b_", ""): spec_included[k]
-        for k in spec_included
-        if k.startswith("ha2b_")
-    }
-
-    # Generate the kwargs for ha.HA3
-    ha3_obj_spec = {
-        k.replace("ha3_", ""): spec_included[k]
-        for k in spec_included
-        if k.startswith("ha3_")
-    }
-
-    state = module.params["state"]
-    commit = module.params["commit"]
+    params = module.params
+    state = params["state"]
+    commit = params["commit"]
 
     # Create the new state object.
-    obj = HighAvailability(**ha_obj_spec)
+    obj = HighAvailability(**{f: params["ha_" + f] for f in _HA_FIELDS})
 
     # Add sub-objects only if at least one param for that type is specified.
-    """
-    obj.add(HA1(**ha1_obj_spec))
-    obj.add(HA1Backup(**ha1b_obj_spec))
-    obj.add(HA2(**ha2_obj_spec))
-    obj.add(HA2Backup(**ha2b_obj_spec))
-    obj.add(HA3(**ha3_obj_spec))
-    """
     class_specs = [
-        (HA1, ha1_obj_spec),
-        (HA1Backup, ha1b_obj_spec),
-        (HA2, ha2_obj_spec),
-        (HA2Backup, ha2b_obj_spec),
-        (HA3, ha3_obj_spec),
+        (HA1, "ha1_", _HA_INTERFACE_FIELDS),
+        (HA1Backup, "ha1b_", _HA_INTERFACE_FIELDS),
+        (HA2, "ha2_", _HA_INTERFACE_FIELDS),
+        (HA2Backup, "ha2b_", _HA_INTERFACE_FIELDS),
+        (HA3, "ha3_", _HA3_FIELDS),
     ]
-    for cls_type, cls_spec in class_specs:
-        if any(x is not None for x in cls_spec.values()):
-            sub_obj = cls_type(**cls_spec)
-            obj.add(sub_obj)
+    sub_objs = []
+    for cls_type, prefix, fields in class_specs:
+        cls_spec = {}
+        for f in fields:
+            value = params[prefix + f]
+            if value is not None:
+                cls_spec[f] = value
+        if cls_spec:
+            sub_objs.append(cls_type(**cls_spec))
+    obj.extend(sub_objs)
 
     # Add ha object to parent
     parent.add(obj)
 
     # HighAvailability.refreshall() is not working for these in pandevice.ha
-    # removing until this is fixed to prevent changed from always equal to True
-    if listing:
+    # removing until this is fixed to prevent changed from always equal to True.
+    # pan-os-python only renders these params when mode is active-active, so the
+    # copy is skipped otherwise, even if they were specified.
+    if listing and obj.mode == "active-active":
         # TODO(shinmog): Not sure if this is still needed or not
         listing[0].session_owner_selection = obj.session_owner_selection
         listing[0].session_setup = obj.session_setup
@@ -17,6 +17,7 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import importlib
 from unittest.mock import MagicMock, Mock, PropertyMock, patch
 
 import pytest
@@ -24,10 +25,12 @@ from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.paloaltonetworks.panos.plugins.module_utils.panos import (
     ConnectionHelper,
     get_connection,
+    to_sdk_cls,
 )
 
 from panos.errors import PanDeviceError
 from panos.firewall import Firewall
+from panos.network import GreTunnel
 from panos.panorama import DeviceGroup, Panorama, Template, TemplateStack
 from panos.policies import PostRulebase, PreRulebase, Rulebase
 
@@ -440,3 +443,14 @@ def test_firewall_error(module_mock):
         parent = helper.get_pandevice_parent(module_mock)
 
     assert e.match("FIREWALL ERROR")
+
+
+# SDK class lookups are cached, so repeat lookups skip the module import.
+def test_to_sdk_cls_cached(mocker):
+    to_sdk_cls.cache_clear()
+    import_mock = mocker.spy(importlib, "import_module")
+
+    assert to_sdk_cls("network", "GreTunnel") is GreTunnel
+    assert to_sdk_cls("network", "GreTunnel") is GreTunnel
+
+    assert import_mock.call_count == 1
@@ -0,0 +1,73 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import pytest
+from ansible_collections.paloaltonetworks.panos.plugins.module_utils.panos import (
+    ConnectionHelper,
+)
+from ansible_collections.paloaltonetworks.panos.plugins.modules import panos_ha
+from ansible_collections.paloaltonetworks.panos.tests.unit.plugins.modules.common.utils import (
+    ModuleTestCase,
+)
+
+from panos.firewall import Firewall
+from panos.ha import HighAvailability
+
+PROVIDER = {"ip_address": "192.168.1.1", "password": "password"}
+
+
+class TestPanosHa(ModuleTestCase):
+    module = panos_ha
+
+    @pytest.fixture
+    def existing(self, mocker):
+        mocker.patch.object(
+            ConnectionHelper, "get_pandevice_parent", return_value=Firewall()
+        )
+
+        # Simulate refreshall() not returning the active-active session params.
+        existing = HighAvailability(mode="active-active")
+        mocker.patch.object(HighAvailability, "refreshall", return_value=[existing])
+        return existing
+
+    @pytest.fixture
+    def apply_state_mock(self, mocker):
+        return mocker.patch.object(
+            ConnectionHelper, "apply_state", return_value={"changed": False}
+        )
+
+    def test_session_params_copied_in_active_active(self, existing, apply_state_mock):
+        self._run_module(
+            {
+                "provider": PROVIDER,
+                "ha_mode": "active-active",
+                "ha_session_owner_selection": "first-packet",
+                "ha_session_setup": "ip-hash",
+            }
+        )
+
+        obj, listing = apply_state_mock.call_args[0][:2]
+        assert listing == [existing]
+        assert existing.session_owner_selection == "first-packet"
+        assert existing.session_setup == "ip-hash"
+        assert obj.mode == "active-active"
+
+    def test_session_params_not_copied_in_active_passive(
+        self, existing, apply_state_mock
+    ):
+        self._run_module(
+            {
+                "provider": PROVIDER,
+                "ha_mode": "active-passive",
+                "ha_session_owner_selection": "first-packet",
+                "ha_session_setup": "ip-hash",
+            }
+        )
+
+        obj, listing = apply_state_mock.call_args[0][:2]
+        assert listing == [existing]
+        assert existing.session_owner_selection is None
+        assert existing.session_setup is None
+        assert obj.session_owner_selection == "first-packet"
+        assert obj.session_setup == "ip-hash"